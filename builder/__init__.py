@@ -6,19 +6,21 @@ for a word-guessing game based on GloVe embeddings.
 """
 
 from .config import Config
-from .embeddings import load_embeddings, load_vocab
+from .embeddings import load_embeddings, load_vocab, load_vocab_mmap
 from .word_of_day import secret_for_date
 from .rankings import compute_rankings
 from .projection import project_to_3d
-from .artifacts import write_daily_artifacts
+from .artifacts import write_daily_artifacts, write_daily_artifacts_batch
 
 __all__ = [
     "Config",
     "load_embeddings",
     "load_vocab", 
+    "load_vocab_mmap",
     "secret_for_date",
     "compute_rankings",
     "project_to_3d",
     "write_daily_artifacts",
+    "write_daily_artifacts_batch",
 ]
 
@@ -8,7 +8,8 @@ generates all the files the browser needs:
 - local_xyz.bin: binary file with 3D coordinates (float32 LE)
 """
 
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,10 @@ import numpy as np
 from numpy.typing import NDArray
 
 from .config import Config
+from .embeddings import load_embeddings
+from .jsonio import dump_json
+from .projection import project_to_3d, projection_seed_for_date
+from .rankings import RankingWorkspace, compute_rankings
 from .word_of_day import hash_secret
 
 
@@ -64,7 +69,7 @@ def write_daily_artifacts(
         "embed_dim": config.embed_dim,
         "projection_method": config.projection_method,
         "projection_params": {},
-        "projection_seed": _seed_from_date(date_str),
+        "projection_seed": projection_seed_for_date(date_str),
         "secret_hash": hash_secret(secret_word, salt=date_str),
         # new in schema v2: reveal support
         "secret_id": int(secret_id),
@@ -72,20 +77,22 @@ def write_daily_artifacts(
     }
     
     meta_path = out / f"{date_str}.meta.json"
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2)
+    dump_json(meta, meta_path, indent=True)
     paths["meta"] = meta_path
     
     # --- local_ids.json ---
     local_ids_path = out / f"{date_str}.local_ids.json"
-    with open(local_ids_path, "w", encoding="utf-8") as f:
-        json.dump([int(x) for x in local_ids], f)
+    dump_json(np.asarray(local_ids, dtype=np.int64).tolist(), local_ids_path)
     paths["local_ids"] = local_ids_path
     
     # --- rank.bin (uint32 little-endian, no header) ---
     rank_path = out / f"{date_str}.rank.bin"
-    rank_le = rank.astype("<u4")  # ensure little-endian uint32
-    rank_le.tofile(rank_path)
+    if isinstance(rank, np.memmap) and Path(rank.filename).resolve() == rank_path.resolve():
+        # already backed by rank.bin (see open_rank_memmap), just flush it
+        rank.flush()
+    else:
+        rank_le = np.ascontiguousarray(rank.astype("<u4", copy=False))  # ensure little-endian uint32
+        _write_raw(rank_path, rank_le)
     paths["rank"] = rank_path
     
     # sanity check
@@ -95,8 +102,8 @@ def write_daily_artifacts(
     
     # --- local_xyz.bin (float32 little-endian, no header) ---
     xyz_path = out / f"{date_str}.local_xyz.bin"
-    coords_flat = coords.astype("<f4")  # ensure little-endian float32
-    coords_flat.tofile(xyz_path)
+    coords_flat = np.ascontiguousarray(coords.astype("<f4", copy=False))  # ensure little-endian float32
+    _write_raw(xyz_path, coords_flat)
     paths["local_xyz"] = xyz_path
     
     # sanity check
@@ -107,9 +114,115 @@ def write_daily_artifacts(
     return paths
 
 
-def _seed_from_date(date_str: str) -> int:
-    """derive a stable integer seed from date."""
-    import hashlib
-    h = hashlib.sha256(date_str.encode("utf-8")).digest()
-    return int.from_bytes(h[8:12], byteorder="little")
+def open_rank_memmap(
+    date_str: str,
+    vocab_size: int,
+    config: Config,
+    output_dir: Path | None = None
+) -> np.memmap:
+    """
+    create {date}.rank.bin as a writable '<u4' memmap of shape (V,).
+
+    pass it as `rank_out` to compute_rankings so ranks land directly in the
+    output file, then hand the same array to write_daily_artifacts, which
+    flushes it instead of writing a second copy. the mapping stays open
+    until the array is garbage collected.
+    """
+    out = output_dir or config.output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    rank_path = out / f"{date_str}.rank.bin"
+    return np.memmap(rank_path, dtype="<u4", mode="w+", shape=(vocab_size,))
+
+
+def write_daily_artifacts_batch(
+    secrets: dict[str, tuple[int, str]],
+    config: Config,
+    output_dir: Path | None = None,
+    max_workers: int | None = None
+) -> dict[str, dict[str, Path]]:
+    """
+    build + write artifacts for many dates in parallel (for backfills).
+    
+    each date is independent, so dates are fanned out over a process pool.
+    every worker mmaps the embeddings once at startup (cheap - pages are
+    shared through the OS cache), allocates one RankingWorkspace it reuses
+    for all of its dates, and runs the usual
+    compute_rankings → project_to_3d → write_daily_artifacts pipeline.
+    
+    args:
+        secrets: date_str → (secret_id, secret_word), already selected
+        config: builder config (embeddings path, k, ...)
+        output_dir: override output directory (default: config.output_dir)
+        max_workers: process count (default: os.cpu_count())
+    
+    returns:
+        dict mapping date_str to that day's artifact paths
+    """
+    out = output_dir or config.output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    workers = min(max_workers or os.cpu_count() or 1, max(len(secrets), 1))
+    
+    jobs = [
+        (date_str, secret_id, secret_word, out)
+        for date_str, (secret_id, secret_word) in secrets.items()
+    ]
+    
+    results: dict[str, dict[str, Path]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_load_embeddings_once,
+        initargs=(config,),
+    ) as pool:
+        for date_str, paths in pool.map(_build_day_worker, jobs):
+            results[date_str] = paths
+    
+    return results
+
+
+# per-process state for write_daily_artifacts_batch workers
+_worker_embeddings: NDArray[np.float32] | None = None
+_worker_config: Config | None = None
+_worker_workspace: RankingWorkspace | None = None
+
+
+def _load_embeddings_once(config: Config) -> None:
+    """pool initializer: mmap the embeddings + allocate ranking buffers once per worker."""
+    global _worker_embeddings, _worker_config, _worker_workspace
+    _worker_embeddings = load_embeddings(config, mmap=True)
+    _worker_config = config
+    _worker_workspace = RankingWorkspace.allocate(_worker_embeddings.shape[0])
+
+
+def _build_day_worker(job: tuple[str, int, str, Path]) -> tuple[str, dict[str, Path]]:
+    """rank + project + write a single date inside a pool worker."""
+    date_str, secret_id, secret_word, out = job
+    embeddings = _worker_embeddings
+    config = _worker_config
+    assert embeddings is not None and config is not None, "worker not initialized"
+    
+    V = embeddings.shape[0]
+    rank_out = open_rank_memmap(date_str, V, config, out)
+    result = compute_rankings(
+        embeddings, secret_id, k=config.k, rank_out=rank_out, workspace=_worker_workspace
+    )
+    coords = project_to_3d(embeddings, result.local_ids)
+    
+    paths = write_daily_artifacts(
+        date_str=date_str,
+        secret_id=secret_id,
+        secret_word=secret_word,
+        vocab_size=V,
+        rank=result.rank,
+        local_ids=result.local_ids,
+        coords=coords,
+        config=config,
+        output_dir=out
+    )
+    return date_str, paths
+
 
+def _write_raw(path: Path, arr: NDArray[Any]) -> None:
+    """write a C-contiguous array's raw bytes in a single buffered write."""
+    with open(path, "wb") as f:
+        # memoryview avoids the extra copy tobytes() would make
+        f.write(memoryview(arr).cast("B"))
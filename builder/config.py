@@ -36,6 +36,9 @@ class Config:
     vocab_file: str = "words.json"
     embeddings_file: str = "embeddings_normed.npy"
     
+    # cached hash-sorted (hash, id) index over the vocab (see load_word_index)
+    word_index_file: str = "word_index.npy"
+    
     def __post_init__(self):
         """ensure paths are Path objects."""
         self.data_dir = Path(self.data_dir)
@@ -48,6 +51,30 @@ class Config:
     @property
     def embeddings_path(self) -> Path:
         return self.data_dir / self.embeddings_file
+    
+    @property
+    def word_index_path(self) -> Path:
+        return self.data_dir / self.word_index_file
+    
+    @property
+    def vocab_bytes_path(self) -> Path:
+        """all vocab words concatenated as one UTF-8 blob (see vocab_offsets_path)."""
+        return self.vocab_path.with_suffix(".bytes")
+    
+    @property
+    def vocab_offsets_path(self) -> Path:
+        """'<u4' offsets [V + 1] into vocab_bytes_path; word i is blob[o[i]:o[i+1]]."""
+        return self.vocab_path.with_suffix(".offsets")
+    
+    @property
+    def embeddings_bin_path(self) -> Path:
+        """headerless '<f4' copy of the embeddings (see embeddings_shape_path)."""
+        return self.embeddings_path.with_suffix(".bin")
+    
+    @property
+    def embeddings_shape_path(self) -> Path:
+        """sidecar JSON with the (V, D) shape of embeddings_bin_path."""
+        return self.embeddings_path.with_suffix(".shape.json")
 
 
 # default config instance
@@ -5,14 +5,21 @@ the heavy lifting (parsing raw .txt) happens in scripts/preprocess_glove.py.
 this module just loads the preprocessed .npy + vocab.
 """
 
-import json
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, overload
 
 import numpy as np
 from numpy.typing import NDArray
 
 from .config import Config, DEFAULT_CONFIG
+from .jsonio import dump_json, load_json
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def load_vocab(config: Config = DEFAULT_CONFIG) -> list[str]:
@@ -21,8 +28,83 @@ def load_vocab(config: Config = DEFAULT_CONFIG) -> list[str]:
     
     returns list where index i → word string.
     """
-    with open(config.vocab_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(config.vocab_path)
+
+
+class MmapVocab(Sequence[str]):
+    """
+    read-only vocab backed by a memory-mapped UTF-8 blob + offsets array.
+
+    drop-in for the list load_vocab returns: vocab[i], len(vocab) and
+    iteration all work, but nothing is decoded until a word is touched.
+    """
+    
+    def __init__(self, blob: NDArray[np.uint8], offsets: NDArray[np.uint32]):
+        self._blob = blob
+        self._offsets = offsets
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+    @overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("vocab index out of range")
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+    
+    def __iter__(self) -> Iterator[str]:
+        blob = self._blob
+        offsets = self._offsets.tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield blob[start:end].tobytes().decode("utf-8")
+
+
+def write_vocab_blob(words: Sequence[str], bytes_path: Path, offsets_path: Path) -> None:
+    """write words as one concatenated UTF-8 blob + '<u4' offsets (see MmapVocab)."""
+    encoded = [w.encode("utf-8") for w in words]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    with open(bytes_path, "wb") as f:
+        f.write(b"".join(encoded))
+    with open(offsets_path, "wb") as f:
+        f.write(memoryview(offsets).cast("B"))
+
+
+def load_vocab_mmap(config: Config = DEFAULT_CONFIG) -> Sequence[str]:
+    """
+    load vocabulary without parsing words.json.
+
+    maps the words.bytes / words.offsets pair written by preprocess_glove.
+    falls back to load_vocab if they're missing or older than words.json.
+    """
+    bytes_path = config.vocab_bytes_path
+    offsets_path = config.vocab_offsets_path
+    if not (bytes_path.exists() and offsets_path.exists()):
+        return load_vocab(config)
+    
+    vocab_mtime = config.vocab_path.stat().st_mtime if config.vocab_path.exists() else 0.0
+    if min(bytes_path.stat().st_mtime, offsets_path.stat().st_mtime) < vocab_mtime:
+        return load_vocab(config)
+    
+    offsets = np.fromfile(offsets_path, dtype="<u4")
+    if bytes_path.stat().st_size == 0:
+        # np.memmap refuses empty files
+        blob = np.zeros(0, dtype=np.uint8)
+    else:
+        blob = np.memmap(bytes_path, dtype=np.uint8, mode="r")
+    if len(offsets) == 0 or int(offsets[-1]) != len(blob):
+        return load_vocab(config)
+    return MmapVocab(blob, offsets)
 
 
 def load_embeddings(
@@ -30,7 +112,11 @@ def load_embeddings(
     mmap: bool = True
 ) -> NDArray[np.float32]:
     """
-    load normalized embeddings from .npy file.
+    load normalized embeddings.
+    
+    prefers the headerless embeddings_normed.bin (+ .shape.json sidecar),
+    which maps straight to a '<f4' array with no .npy header parsing;
+    falls back to embeddings_normed.npy if they're missing or older than it.
     
     args:
         config: builder config with paths
@@ -38,9 +124,66 @@ def load_embeddings(
     
     returns:
         array of shape (V, embed_dim) with L2-normalized rows
+
+    the file is always written as little-endian float32 ('<f4') by
+    preprocess_glove, so the mmap can feed BLAS directly without a byteswap.
     """
+    bin_path = config.embeddings_bin_path
+    shape_path = config.embeddings_shape_path
+    npy_path = config.embeddings_path
+    use_bin = bin_path.exists() and shape_path.exists()
+    if use_bin and npy_path.exists():
+        # a .bin left over from an older preprocess run must not shadow a
+        # newer .npy (preprocess_glove writes the .npy first)
+        bin_mtime = min(bin_path.stat().st_mtime, shape_path.stat().st_mtime)
+        use_bin = bin_mtime >= npy_path.stat().st_mtime
+    if use_bin:
+        shape_info = load_json(shape_path)
+        shape = (shape_info["vocab_size"], shape_info["embed_dim"])
+        
+        # validate against the file size up front, before mapping/reading
+        expected_size = 4 * shape[0] * shape[1]
+        actual_size = bin_path.stat().st_size
+        if actual_size != expected_size:
+            raise ValueError(
+                f"{bin_path.name} size mismatch: {actual_size} != {expected_size}"
+            )
+        
+        # preprocess_glove records that rows were L2-normalized, so the
+        # common path never touches the data; sidecars that predate the
+        # flag were always normalized too. an un-normalized .bin is fixed
+        # up once and written back, so later loads take the fast path.
+        if not shape_info.get("normalized", True):
+            embeddings = _normalize_rows(np.fromfile(bin_path, dtype="<f4").reshape(shape))
+            tmp_path = bin_path.with_name(bin_path.name + ".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(memoryview(embeddings).cast("B"))
+                os.replace(tmp_path, bin_path)
+                dump_json({**shape_info, "normalized": True}, shape_path)
+            except OSError:
+                # read-only data dir: normalize in memory on every load
+                tmp_path.unlink(missing_ok=True)
+                return embeddings
+        
+        if mmap:
+            return np.memmap(bin_path, dtype="<f4", mode="r", shape=shape)
+        # fromfile gives a writable array, like np.load(mmap_mode=None)
+        return np.fromfile(bin_path, dtype="<f4").reshape(shape)
+    
     mode = "r" if mmap else None
-    return np.load(config.embeddings_path, mmap_mode=mode)
+    return np.load(npy_path, mmap_mode=mode)
+
+
+def _normalize_rows(embeddings: NDArray[np.float32]) -> NDArray[np.float32]:
+    """L2-normalize rows in place (zero rows stay zero)."""
+    norms = np.linalg.norm(embeddings, axis=1)
+    # avoid division by zero (shouldn't happen with GloVe, but just in case)
+    np.maximum(norms, 1e-8, out=norms)
+    # scale in place so we never hold a second (V, D) copy
+    inv_norms = np.reciprocal(norms, dtype=np.float32)
+    np.multiply(embeddings, inv_norms[:, None], out=embeddings)
+    return embeddings
 
 
 def build_word_to_id(vocab: list[str]) -> dict[str, int]:
@@ -52,6 +195,200 @@ def build_word_to_id(vocab: list[str]) -> dict[str, int]:
     return {word: i for i, word in enumerate(vocab)}
 
 
+# structured dtype for the on-disk word index: sorted by stable word hash
+WORD_INDEX_DTYPE = np.dtype([("hash", "<u8"), ("id", "<u4")])
+
+
+def _word_hash(word: str) -> int:
+    """stable 64-bit hash of a word (python's hash() is salted per process)."""
+    return int.from_bytes(
+        hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def build_word_index(vocab: Sequence[str]) -> NDArray[np.void]:
+    """
+    build a hash-sorted (hash, id) array over the vocab.
+
+    a compact, mmap-able stand-in for build_word_to_id: lookups go through
+    np.searchsorted instead of a ~V-entry python dict.
+    """
+    index = np.empty(len(vocab), dtype=WORD_INDEX_DTYPE)
+    index["hash"] = np.fromiter((_word_hash(w) for w in vocab), dtype=np.uint64, count=len(vocab))
+    index["id"] = np.arange(len(vocab), dtype=np.uint32)
+    # stable, so duplicate words keep ascending ids
+    return index[np.argsort(index["hash"], kind="stable")]
+
+
+def load_word_index(config: Config, vocab: Sequence[str]) -> NDArray[np.void]:
+    """
+    load the cached word index, rebuilding it if words.json is newer.
+
+    the cache lives at config.word_index_path and is memory-mapped, so
+    repeated daily builds skip hashing the whole vocab.
+    """
+    path = config.word_index_path
+    if path.exists() and path.stat().st_mtime >= config.vocab_path.stat().st_mtime:
+        try:
+            index = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            index = None  # unreadable (e.g. truncated) cache: rebuild it
+        if index is not None and index.dtype == WORD_INDEX_DTYPE and len(index) == len(vocab):
+            return index
+
+    index = build_word_index(vocab)
+    # write-then-rename so an interrupted save never leaves a newer,
+    # half-written cache behind
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.save(f, index)
+        os.replace(tmp_path, path)
+    except OSError:
+        # read-only data dir: just use the in-memory index
+        tmp_path.unlink(missing_ok=True)
+    return index
+
+
+def lookup_word_ids(
+    words: list[str],
+    vocab: Sequence[str],
+    index: NDArray[np.void]
+) -> NDArray[np.int64]:
+    """
+    vocab ids for each word via the word index (-1 if not in vocab).
+
+    matches build_word_to_id semantics: a duplicated vocab word maps to its
+    last id. hash hits are verified against vocab, so collisions can't
+    return a wrong id.
+    """
+    if not words or len(index) == 0:
+        return np.full(len(words), -1, dtype=np.int64)
+
+    hashes = np.fromiter((_word_hash(w) for w in words), dtype=np.uint64, count=len(words))
+    pos = np.searchsorted(index["hash"], hashes, side="right") - 1
+    pos = np.clip(pos, 0, len(index) - 1)
+    found = index["hash"][pos] == hashes
+    ids = np.where(found, index["id"][pos].astype(np.int64), -1)
+
+    for j in np.flatnonzero(found).tolist():
+        if vocab[ids[j]] != words[j]:
+            ids[j] = -1
+    return ids
+
+
+# don't bother splitting the GloVe parse into chunks smaller than this
+_PARSE_MIN_CHUNK_BYTES = 32 * 1024 * 1024
+
+# how many leading lines to look through for a well-formed GloVe row
+_WIDTH_SNIFF_LINES = 100
+
+
+def _check_glove_width(glove_path: Path, expected_dim: int) -> None:
+    """
+    fail fast if glove_path clearly isn't expected_dim-dimensional.
+
+    looks for a well-formed row (word + expected_dim floats) among the first
+    few lines, so a header (e.g. word2vec's "V D") or a malformed first line
+    is just skipped later instead of aborting the run.
+    """
+    widths: list[int] = []
+    with open(glove_path, "r", encoding="utf-8") as f:
+        for line in islice(f, _WIDTH_SNIFF_LINES):
+            parts = line.rstrip().split(" ")
+            if len(parts) < 2:
+                continue
+            try:
+                list(map(float, parts[1:]))
+            except ValueError:
+                continue
+            if len(parts) == expected_dim + 1:
+                return
+            widths.append(len(parts))
+    if widths:
+        raise ValueError(
+            f"expected {expected_dim + 1} columns in {glove_path}, "
+            f"got {max(set(widths), key=widths.count)}"
+        )
+    raise ValueError(f"no well-formed rows near the start of {glove_path}")
+
+
+def _line_aligned_offsets(path: Path, size: int, n_chunks: int) -> list[int]:
+    """byte offsets splitting path into ~n_chunks ranges that start on a line."""
+    offsets = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n_chunks):
+            f.seek(size * i // n_chunks)
+            f.readline()  # finish the line we landed in
+            pos = f.tell()
+            if pos > offsets[-1] and pos < size:
+                offsets.append(pos)
+    offsets.append(size)
+    return offsets
+
+
+def _parse_glove_chunk(
+    glove_path: Path,
+    start: int,
+    end: int,
+    expected_dim: int
+) -> tuple["pd.Series", NDArray[np.float32], int]:
+    """
+    parse bytes [start, end) of a GloVe .txt file.
+
+    returns (word column, (n, expected_dim) float32 vectors, skipped lines).
+    """
+    import csv
+    import io
+
+    import pandas as pd
+
+    with open(glove_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # bulk parse with pandas' C reader: one word column + expected_dim floats.
+    # quoting/na_filter are disabled so tokens like '"' or "nan" stay words.
+    # columns are fixed up front (a chunk's first line may be malformed), with
+    # one spare column so a too-wide row parses and can be rejected below
+    # instead of being truncated; index_col=False stops pandas from turning
+    # column 0 into an index when the first row is wider than `names`.
+    # a single trailing space lands in the spare column as '' and is fine.
+    # preprocess_glove checks the real width beforehand.
+    n_cols = expected_dim + 1
+    df = pd.read_csv(
+        io.BytesIO(data),
+        sep=" ",
+        header=None,
+        names=list(range(n_cols + 1)),
+        index_col=False,
+        quoting=csv.QUOTE_NONE,
+        engine="c",
+        dtype={0: str},
+        na_filter=False,
+        encoding="utf-8",
+        on_bad_lines="skip",
+    )
+
+    # rows even wider than the spare column are dropped by on_bad_lines;
+    # count them from the non-blank lines pandas didn't return
+    n_lines = sum(1 for line in data.split(b"\n") if line.strip())
+    skipped = max(0, n_lines - len(df))
+
+    # malformed floats (and missing fields) become NaN; too-wide rows have
+    # the spare column populated. both get dropped
+    values = df.iloc[:, 1:n_cols].apply(pd.to_numeric, errors="coerce")
+    valid = ~values.isna().any(axis=1).to_numpy()
+    valid &= (df[n_cols].astype(str) == "").to_numpy()
+    skipped += int((~valid).sum())
+
+    # keep words as a pandas column so filter_vocab can run its predicates
+    # column-wise; only the surviving words become a python list
+    word_col = df.iloc[valid, 0].astype(str)
+    embeddings = values.to_numpy(dtype=np.float32)[valid]
+    return word_col, embeddings, skipped
+
+
 def preprocess_glove(
     glove_path: Path,
     output_vocab_path: Path,
@@ -63,6 +400,7 @@ def preprocess_glove(
     obscene_words_path: Optional[Path] = None,
     lemmatize: bool = True,
     lemma_output_path: Optional[Path] = None,
+    workers: Optional[int] = None,
 ) -> int:
     """
     one-time preprocessing: raw GloVe .txt → words.json + embeddings_normed.npy
@@ -77,45 +415,51 @@ def preprocess_glove(
         english_dict_path: optional path to words_dictionary.json
         lemmatize: if True, create lemma mapping (default: True)
         lemma_output_path: where to write lemma mapping JSON (default: vocab_dir/lemmas.json)
+        workers: processes for parsing the .txt (default: cpu_count; files
+                 under 64MB are always parsed in-process)
     
     returns:
         vocab size V
     """
+    import pandas as pd
+
     from .filters import (
         filter_vocab as apply_filters,
         load_english_dictionary,
         load_obscene_words,
     )
 
-    words: list[str] = []
-    vectors: list[list[float]] = []
-
     print(f"reading {glove_path}...")
-    with open(glove_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            parts = line.rstrip().split(" ")
-
-            # first part is the word, rest are floats
-            word = parts[0]
-
-            # some lines might have issues, skip them
-            if len(parts) != expected_dim + 1:
-                print(f"  skipping line {line_num}: expected {expected_dim + 1} parts, got {len(parts)}")
-                continue
-
-            try:
-                vec = [float(x) for x in parts[1:]]
-            except ValueError as e:
-                print(f"  skipping line {line_num}: {e}")
-                continue
-
-            words.append(word)
-            vectors.append(vec)
-
-            if line_num % 100_000 == 0:
-                print(f"  processed {line_num:,} lines...")
-
-    raw_count = len(words)
+    _check_glove_width(glove_path, expected_dim)
+
+    size = glove_path.stat().st_size
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, size // _PARSE_MIN_CHUNK_BYTES))
+
+    if workers > 1:
+        # shard on line boundaries; each worker parses its byte range
+        bounds = _line_aligned_offsets(glove_path, size, workers)
+        print(f"  parsing in {len(bounds) - 1} chunks across {workers} processes...")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                _parse_glove_chunk,
+                [glove_path] * (len(bounds) - 1),
+                bounds[:-1],
+                bounds[1:],
+                [expected_dim] * (len(bounds) - 1),
+            ))
+        word_col = pd.concat([p[0] for p in parts], ignore_index=True)
+        embeddings = np.concatenate([p[1] for p in parts])
+        skipped = sum(p[2] for p in parts)
+        del parts
+    else:
+        word_col, embeddings, skipped = _parse_glove_chunk(glove_path, 0, size, expected_dim)
+
+    if skipped:
+        print(f"  skipping {skipped:,} malformed lines")
+
+    raw_count = len(word_col)
     print(f"loaded {raw_count:,} words (raw)")
 
     english_words = None
@@ -134,40 +478,55 @@ def preprocess_glove(
     # apply vocabulary filters
     if filter_vocab:
         print("filtering vocabulary...")
-        words, vectors, _stats = apply_filters(
-            words,
-            vectors,
+        words, embeddings, _stats = apply_filters(
+            word_col,
+            embeddings,
             min_length=min_word_length,
             english_words=english_words,
             obscene_words=obscene_words,
             verbose=True,
         )
+    else:
+        words = word_col.tolist()
+    del word_col
 
     V = len(words)
     print(f"final vocab size: {V:,}")
 
-    # convert to numpy
-    print("converting to numpy array...")
-    embeddings = np.array(vectors, dtype=np.float32)
+    # vectors stay a (V, D) float32 array end to end - no list rebuild
     assert embeddings.shape == (V, expected_dim), f"shape mismatch: {embeddings.shape}"
 
     # normalize rows (L2 norm)
     print("normalizing vectors...")
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-
-    # avoid division by zero (shouldn't happen with GloVe, but just in case)
-    norms = np.maximum(norms, 1e-8)
-    embeddings_normed = embeddings / norms
+    _normalize_rows(embeddings)
 
     # save outputs
     print(f"saving vocab to {output_vocab_path}...")
     output_vocab_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_vocab_path, "w", encoding="utf-8") as f:
-        json.dump(words, f)
+    dump_json(words, output_vocab_path)
+
+    # mmap-able copy of the vocab for load_vocab_mmap
+    write_vocab_blob(
+        words,
+        output_vocab_path.with_suffix(".bytes"),
+        output_vocab_path.with_suffix(".offsets"),
+    )
 
     print(f"saving embeddings to {output_embeddings_path}...")
     output_embeddings_path.parent.mkdir(parents=True, exist_ok=True)
-    np.save(output_embeddings_path, embeddings_normed)
+    # explicit little-endian float32 so the .npy mmaps without byteswaps anywhere
+    embeddings = np.ascontiguousarray(embeddings, dtype="<f4")
+    np.save(output_embeddings_path, embeddings)
+
+    # same data as a headerless .bin + shape sidecar for load_embeddings
+    bin_path = output_embeddings_path.with_suffix(".bin")
+    print(f"saving raw embeddings to {bin_path}...")
+    with open(bin_path, "wb") as f:
+        f.write(memoryview(embeddings).cast("B"))
+    dump_json(
+        {"vocab_size": V, "embed_dim": expected_dim, "dtype": "<f4", "normalized": True},
+        output_embeddings_path.with_suffix(".shape.json"),
+    )
 
     # lemmatization: create word -> lemma mapping and lemma -> words mapping
     if lemmatize:
@@ -202,8 +561,7 @@ def preprocess_glove(
                 
                 print(f"saving lemma mapping to {lemma_output_path}...")
                 lemma_output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(lemma_output_path, "w", encoding="utf-8") as f:
-                    json.dump(lemma_data, f, indent=2)
+                dump_json(lemma_data, lemma_output_path, indent=True)
                 
                 print(f"  saved {len(lemma_map):,} word->lemma mappings")
                 print(f"  {len(lemma_to_words):,} unique lemmas")
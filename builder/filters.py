@@ -12,8 +12,26 @@ filters out:
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Set
+from typing import TYPE_CHECKING, AbstractSet, Collection, Iterable, Sequence, Set
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# check for marisa-trie availability (compact storage for big wordlists)
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+
+# wordlists at least this big are stored as a marisa trie when available;
+# smaller ones stay as plain sets (faster lookups, memory doesn't matter)
+TRIE_MIN_WORDS = 10_000
 
 # common english stopwords (feel free to expand)
 STOPWORDS = frozenset([
@@ -56,6 +74,10 @@ REPEATED_CHARS = re.compile(r"(.)\1{2,}")
 # regex for words that are mostly numbers or have digits
 HAS_DIGITS = re.compile(r"\d")
 
+# regex for lowercase ascii-alphabetic words (isalpha + isascii in one call)
+ASCII_ALPHA = re.compile(r"[a-z]+")
+_is_ascii_alpha = ASCII_ALPHA.fullmatch
+
 # common url/internet fragments to filter
 INTERNET_GARBAGE = frozenset([
     "http", "https", "www", "com", "org", "net", "html", "htm", "php",
@@ -64,8 +86,37 @@ INTERNET_GARBAGE = frozenset([
     "af", "irl", "fomo", "yolo", "smh", "fml", "tfw", "mfw",
 ])
 
+# both blocklists fused so the hot path does one set lookup per word
+_REJECT_FAST = STOPWORDS | INTERNET_GARBAGE
+
+
+def _compact_wordset(words: AbstractSet[str]) -> Collection[str]:
+    """store a large wordlist as a marisa trie (10-100x smaller than a set).
+
+    supports the same `w in words` / len() / iteration as a set.
+    """
+    if MARISA_AVAILABLE and len(words) >= TRIE_MIN_WORDS:
+        return marisa_trie.Trie(words)
+    return words
 
-def load_obscene_words(path: Path | None = None) -> Set[str]:
+
+def _member_mask(col: "pd.Series", words: Collection[str]) -> NDArray[np.bool_]:
+    """vectorized `w in words` over a pandas column of strings."""
+    if isinstance(words, (set, frozenset)):
+        return col.isin(words).to_numpy()
+    # tries: probe directly rather than expanding into a temp hash table
+    return col.map(words.__contains__).to_numpy(dtype=np.bool_)
+
+
+def _file_stamp(path: Path) -> tuple[str, int] | None:
+    """(path, mtime_ns) cache key for a wordlist file, or None if absent."""
+    try:
+        return (str(path), path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+
+def load_obscene_words(path: Path | None = None) -> Collection[str]:
     """load a newline-separated obscene / blacklist word list.
 
     priority:
@@ -74,6 +125,9 @@ def load_obscene_words(path: Path | None = None) -> Set[str]:
       3. `data/blacklist.txt` if present
 
     each non-empty, non-comment line is treated as a word to filter.
+    very large lists come back as a marisa trie (see _compact_wordset).
+    parsed lists are cached per (path, mtime), so repeat calls in one
+    process are free until a file changes.
     """
     candidates: list[Path] = []
 
@@ -83,10 +137,14 @@ def load_obscene_words(path: Path | None = None) -> Set[str]:
         candidates.append(Path("data/obscene_words.txt"))
         candidates.append(Path("data/blacklist.txt"))
 
+    stamps = tuple(s for s in map(_file_stamp, candidates) if s is not None)
+    return _read_obscene_files(stamps)
+
+
+@lru_cache(maxsize=4)
+def _read_obscene_files(stamps: tuple[tuple[str, int], ...]) -> Collection[str]:
     words: Set[str] = set()
-    for p in candidates:
-        if not p.exists():
-            continue
+    for p, _mtime_ns in stamps:
         with open(p, "r", encoding="utf-8") as f:
             for line in f:
                 raw = line.strip().lower()
@@ -95,27 +153,33 @@ def load_obscene_words(path: Path | None = None) -> Set[str]:
                 if raw.isascii():
                     words.add(raw)
 
-    return words
+    return _compact_wordset(frozenset(words))
 
 
-def load_english_dictionary(path: Path) -> Set[str]:
+def load_english_dictionary(path: Path) -> Collection[str]:
   """load a local english wordlist (words_dictionary.json-style).
 
   expects a JSON object { word: frequency_or_1, ... }.
-  returns a set of lowercase words.
+  returns a set of lowercase words (a marisa trie if installed - full
+  english wordlists are large). cached per (path, mtime).
   """
+  return _read_english_dictionary(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _read_english_dictionary(path: str, mtime_ns: int) -> Collection[str]:
   with open(path, "r", encoding="utf-8") as f:
       data = json.load(f)
   # keys are words
-  return {str(k).lower() for k in data.keys()}
+  return _compact_wordset(frozenset(str(k).lower() for k in data.keys()))
 
 
 def is_valid_word(
     word: str,
     *,
     min_length: int = 3,
-    english_words: Set[str] | None = None,
-    obscene_words: Set[str] | None = None,
+    english_words: Collection[str] | None = None,
+    obscene_words: Collection[str] | None = None,
 ) -> bool:
     """check if a word passes all filters.
 
@@ -125,22 +189,18 @@ def is_valid_word(
     if len(word) < min_length:
         return False
 
+    w = word.lower()
+
     # must be ASCII alphabetic only (force english-ish)
-    if not word.isalpha() or not word.isascii():
+    if not _is_ascii_alpha(w):
         return False
 
-    w = word.lower()
-
     # restrict to english dictionary if provided
     if english_words is not None and w not in english_words:
         return False
 
-    # skip stopwords
-    if w in STOPWORDS:
-        return False
-
-    # skip internet garbage
-    if w in INTERNET_GARBAGE:
+    # skip stopwords + internet garbage
+    if w in _REJECT_FAST:
         return False
 
     # explicit obscene/slur blocklist
@@ -154,27 +214,66 @@ def is_valid_word(
     return True
 
 
+def has_repeated_chars(words: Sequence[str]) -> NDArray[np.bool_]:
+    """vectorized REPEATED_CHARS check over a whole word list.
+
+    joins all words into one byte buffer (with a NUL separator) and looks
+    for any position where three consecutive bytes match, then maps hits
+    back to word indices. non-ascii chars are encoded as '?' so byte
+    offsets line up with str lengths; callers reject those words anyway.
+
+    returns:
+        bool array, True where the word has 3+ of the same char in a row
+    """
+    V = len(words)
+    out = np.zeros(V, dtype=np.bool_)
+    if V == 0:
+        return out
+
+    buf = np.frombuffer("\0".join(words).encode("ascii", "replace"), dtype=np.uint8)
+    triple = (buf[:-2] == buf[1:-1]) & (buf[1:-1] == buf[2:]) & (buf[:-2] != 0)
+    hits = np.flatnonzero(triple)
+    if hits.size == 0:
+        return out
+
+    # start offset of each word in buf (+1 per separator)
+    lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=V)
+    starts = np.zeros(V, dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=starts[1:])
+    out[np.searchsorted(starts, hits, side="right") - 1] = True
+    return out
+
+
 def filter_vocab(
-    words: list[str],
-    vectors: list[list[float]],
+    words: Sequence[str],
+    vectors: NDArray[np.float32],
     *,
     min_length: int = 3,
-    english_words: Set[str] | None = None,
-    obscene_words: Set[str] | None = None,
+    english_words: Collection[str] | None = None,
+    obscene_words: Collection[str] | None = None,
     verbose: bool = True,
-) -> tuple[list[str], list[list[float]], dict[str, int]]:
+) -> tuple[list[str], NDArray[np.float32], dict[str, int]]:
     """filter vocabulary and corresponding vectors.
 
+    every filter runs as a column-wise pandas/numpy predicate over the
+    whole vocab (words may be a pandas Series straight from the loader).
+    predicates are ANDed into one keep-mask in priority order, so each
+    rejected word is counted once under the first filter it fails. rows
+    of `vectors` are selected with a single fancy index at the end.
+
     returns:
         filtered_words: cleaned word list
-        filtered_vectors: corresponding vectors
+        filtered_vectors: corresponding rows of `vectors`
         stats: dict with filtering statistics
     """
-    filtered_words: list[str] = []
-    filtered_vectors: list[list[float]] = []
+    import pandas as pd
+
+    lowered = pd.Series(words, dtype=object).str.lower()
+    V = len(lowered)
+    keep = np.ones(V, dtype=np.bool_)
 
     stats = {
-        "total": len(words),
+        "total": V,
         "kept": 0,
         "too_short": 0,
         "non_alpha_or_non_ascii": 0,
@@ -185,44 +284,39 @@ def filter_vocab(
         "obscene": 0,
     }
 
-    for word, vec in zip(words, vectors):
-        w = word.lower()
-
-        # length
-        if len(w) < min_length:
-            stats["too_short"] += 1
-            continue
+    def gate(name: str, passed: NDArray[np.bool_]) -> None:
+        stats[name] = int(np.count_nonzero(keep & ~passed))
+        np.logical_and(keep, passed, out=keep)
 
-        # must be ascii alpha
-        if not w.isalpha() or not w.isascii():
-            stats["non_alpha_or_non_ascii"] += 1
-            continue
+    # length
+    gate("too_short", lowered.str.len().to_numpy() >= min_length)
 
-        # english dictionary gate
-        if english_words is not None and w not in english_words:
-            stats["not_in_dict"] += 1
-            continue
+    # must be ascii alpha
+    gate(
+        "non_alpha_or_non_ascii",
+        lowered.str.fullmatch(ASCII_ALPHA.pattern).to_numpy(dtype=np.bool_),
+    )
 
-        if w in STOPWORDS:
-            stats["stopword"] += 1
-            continue
+    # english dictionary gate
+    if english_words is not None:
+        gate("not_in_dict", _member_mask(lowered, english_words))
 
-        if w in INTERNET_GARBAGE:
-            stats["internet_garbage"] += 1
-            continue
+    # stopwords + internet garbage share one lookup; split only for stats
+    # (only the rejected words get the second, stopword-vs-garbage lookup)
+    rejected = lowered.isin(_REJECT_FAST).to_numpy()
+    stopword = np.zeros(V, dtype=np.bool_)
+    stopword[rejected] = lowered[rejected].isin(STOPWORDS).to_numpy()
+    gate("stopword", ~stopword)
+    gate("internet_garbage", ~rejected)
 
-        if obscene_words is not None and w in obscene_words:
-            stats["obscene"] += 1
-            continue
+    if obscene_words is not None:
+        gate("obscene", ~_member_mask(lowered, obscene_words))
 
-        if REPEATED_CHARS.search(w):
-            stats["repeated_chars"] += 1
-            continue
+    gate("repeated_chars", ~has_repeated_chars(lowered))
 
-        # passed all filters
-        filtered_words.append(w)
-        filtered_vectors.append(vec)
-        stats["kept"] += 1
+    stats["kept"] = int(np.count_nonzero(keep))
+    filtered_words: list[str] = lowered[keep].tolist()
+    filtered_vectors = vectors[keep]
 
     if verbose:
         print("  filtering stats:")
@@ -0,0 +1,57 @@
+"""
+json reading / writing helpers.
+
+uses orjson (C-implemented, much faster on the big vocab / lemma files)
+when it's installed, and falls back to the stdlib json module otherwise.
+output is plain UTF-8 JSON either way, so readers don't care which wrote it.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# check for orjson availability
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json(obj: Any, path: Path, indent: bool = False) -> None:
+    """
+    serialize obj to path as UTF-8 JSON.
+
+    written to a temp file next to path and renamed over it, so readers
+    never see a partial file and a hardlinked copy (see setup_docs) keeps
+    the old contents instead of being rewritten in place.
+
+    args:
+        obj: JSON-compatible python object (native ints/floats/strs only)
+        path: output file
+        indent: pretty-print with 2-space indentation
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(obj, option=option))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(obj, f, indent=2 if indent else None)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_json(path: Path) -> Any:
+    """parse a UTF-8 JSON file (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -11,36 +11,92 @@ spaCy + LemmInflect are optional - only needed for preprocessing (generating lem
 The server/frontend use pre-generated lemmas.json and don't require these libraries.
 """
 
+import importlib.util
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Dict, List, Optional
 
-# check for spaCy availability
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+# check for spaCy / LemmInflect availability without importing them -
+# spaCy alone takes ~500ms to import, and most builder workflows never
+# lemmatize. the real imports happen in Lemmatizer.__init__.
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
+LEMMINFLECT_AVAILABLE = importlib.util.find_spec("lemminflect") is not None
 
-# check for LemmInflect availability
-try:
-    import lemminflect
-    from lemminflect import getLemma, getAllLemmas, getAllLemmasOOV
-    LEMMINFLECT_AVAILABLE = True
-except ImportError:
-    LEMMINFLECT_AVAILABLE = False
+
+# POS preference for fast-mode lookups (no tagger to tell us the real POS)
+_FAST_POS_ORDER = ("VERB", "NOUN", "ADJ", "ADV")
+
+# words per spaCy pipe batch. every doc is a single token, so per-batch
+# overhead (and worker IPC) dominates - larger batches amortize it
+DEFAULT_BATCH_SIZE = 5000
+
+# below this many words, worker startup (+ a spaCy load each) costs more
+# than it saves, so create_lemma_mapping stays in-process
+_PARALLEL_MIN_WORDS = 10_000
+
+
+def _default_n_process() -> int:
+    """leave one core free for the parent process."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+@lru_cache(maxsize=65536)
+def _lookup_lemma(word: str) -> str:
+    """
+    lemmatize an isolated word with a plain LemmInflect dictionary lookup.
+
+    vocab entries are single tokens, so a tagger has no context to work
+    with anyway - we just take the first known POS in _FAST_POS_ORDER.
+    """
+    from lemminflect import getAllLemmas
+    
+    lemmas = getAllLemmas(word)
+    for upos in _FAST_POS_ORDER:
+        if lemmas.get(upos):
+            return lemmas[upos][0].lower()
+    return word.lower()
+
+
+def _is_base_form(word: str) -> bool:
+    """
+    True if LemmInflect knows the word and every reading of it is the word itself.
+
+    for these the POS tag can't change the answer, so the spaCy path maps
+    them straight to themselves. ambiguous words ("left" -> leave) and
+    unknown ones still go through the tagger.
+    """
+    from lemminflect import getAllLemmas
+    
+    lemmas = getAllLemmas(word)
+    if not lemmas:
+        return False
+    w = word.lower()
+    return all(lemma_tuple[0].lower() == w for lemma_tuple in lemmas.values() if lemma_tuple)
 
 
 class Lemmatizer:
     """lemmatizer wrapper using LemmInflect for improved accuracy."""
     
-    def __init__(self, model_name: str = "en_core_web_sm", disable: Optional[List[str]] = None):
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        disable: Optional[List[str]] = None,
+        fast_mode: bool = False
+    ):
         """
         initialize lemmatizer with spaCy for POS tagging and LemmInflect for lemmatization.
         
         args:
             model_name: spaCy model to use (default: en_core_web_sm)
-            disable: pipeline components to disable for speed (default: ["parser", "ner"])
+            disable: pipeline components to disable for speed
+                     (default: ["parser", "ner", "lemmatizer"])
+            fast_mode: skip spaCy entirely and use direct LemmInflect lookups
         """
-        if not SPACY_AVAILABLE:
+        self.fast_mode = fast_mode
+        self.nlp = None
+        
+        if not fast_mode and not SPACY_AVAILABLE:
             raise RuntimeError(
                 "spaCy is not installed. "
                 "Install it with: pip install spacy && python -m spacy download en_core_web_sm"
@@ -52,8 +108,19 @@ class Lemmatizer:
                 "Install it with: pip install lemminflect"
             )
         
+        # importing lemminflect also registers the _.lemma() token extension
+        import lemminflect  # noqa: F401
+        
+        if fast_mode:
+            return
+        
+        import spacy
+        
         if disable is None:
-            disable = ["parser", "ner"]  # only need tokenizer + tagger
+            # only need tokenizer + tagger. spaCy's own lemmatizer is dropped
+            # too - LemmInflect replaces it, and the rule lemmatizer is one of
+            # the slower components per doc
+            disable = ["parser", "ner", "lemmatizer"]
         
         try:
             self.nlp = spacy.load(model_name, disable=disable)
@@ -74,6 +141,9 @@ class Lemmatizer:
         returns:
             lemma (base form) of the word
         """
+        if self.fast_mode:
+            return _lookup_lemma(word)
+        
         doc = self.nlp(word)
         if len(doc) == 0:
             return word.lower()
@@ -82,10 +152,10 @@ class Lemmatizer:
         # use LemmInflect's _.lemma() method which is more accurate than spaCy's
         try:
             lemma = token._.lemma()
-            return lemma.lower() if lemma else token.lemma_.lower()
+            return lemma.lower() if lemma else self._get_best_lemma(word, token.pos_)
         except Exception:
-            # fallback to spaCy's lemma if LemmInflect fails
-            return token.lemma_.lower()
+            # fallback: direct LemmInflect lookup (spaCy's lemmatizer is disabled)
+            return self._get_best_lemma(word, token.pos_)
     
     def _get_best_lemma(self, word: str, pos: str) -> str:
         """
@@ -99,6 +169,8 @@ class Lemmatizer:
         returns:
             the best lemma for the word
         """
+        from lemminflect import getAllLemmas, getAllLemmasOOV
+        
         # map spaCy POS to LemmInflect UPOS
         upos = pos.upper()
         
@@ -119,43 +191,61 @@ class Lemmatizer:
         # ultimate fallback: return word as-is
         return word.lower()
     
-    def lemmatize_batch(self, words: List[str], batch_size: int = 1000) -> Dict[str, str]:
+    def lemmatize_batch(
+        self,
+        words: List[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: Optional[int] = None
+    ) -> Dict[str, str]:
         """
         lemmatize a batch of words efficiently using LemmInflect.
         
         args:
             words: list of words to lemmatize
-            batch_size: number of words to process at once
+            batch_size: number of words spaCy sends to each worker at once
+            n_process: spaCy worker processes (default: cpu_count - 1)
         
         returns:
             dict mapping word -> lemma
         """
+        if self.fast_mode:
+            return {word: _lookup_lemma(word) for word in words}
+        
+        if n_process is None:
+            n_process = _default_n_process()
+        
         lemma_map: Dict[str, str] = {}
         
-        # process in batches
-        for i in range(0, len(words), batch_size):
-            batch = words[i:i + batch_size]
-            
-            # process batch - each word becomes its own doc
-            docs = list(self.nlp.pipe(batch, batch_size=batch_size))
-            
-            for word, doc in zip(batch, docs):
-                if len(doc) > 0:
-                    token = doc[0]
-                    # use LemmInflect's enhanced lemma method
-                    try:
-                        lemma = token._.lemma()
-                        lemma_map[word] = lemma.lower() if lemma else self._get_best_lemma(word, token.pos_)
-                    except Exception:
-                        # fallback: try direct LemmInflect lookup with POS
-                        lemma_map[word] = self._get_best_lemma(word, token.pos_)
-                else:
-                    # fallback: use word as-is if tokenization failed
-                    lemma_map[word] = word.lower()
-        
-        return lemma_map
+        # words already in base form under every POS skip spaCy entirely
+        needs_tagging: List[str] = []
+        for word in words:
+            if _is_base_form(word):
+                lemma_map[word] = word.lower()
+            else:
+                needs_tagging.append(word)
+        
+        # one pipe over the rest - spaCy's own batcher shards it across
+        # workers. each word becomes its own doc.
+        docs = self.nlp.pipe(needs_tagging, batch_size=batch_size, n_process=n_process)
+        
+        for word, doc in zip(needs_tagging, docs):
+            if len(doc) > 0:
+                token = doc[0]
+                # use LemmInflect's enhanced lemma method
+                try:
+                    lemma = token._.lemma()
+                    lemma_map[word] = lemma.lower() if lemma else self._get_best_lemma(word, token.pos_)
+                except Exception:
+                    # fallback: try direct LemmInflect lookup with POS
+                    lemma_map[word] = self._get_best_lemma(word, token.pos_)
+            else:
+                # fallback: use word as-is if tokenization failed
+                lemma_map[word] = word.lower()
+        
+        # restore input order (lemmas.json is written in vocab order)
+        return {word: lemma_map[word] for word in words}
     
-    def build_lemma_to_words(self, words: List[str], batch_size: int = 1000) -> Dict[str, List[str]]:
+    def build_lemma_to_words(self, words: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, List[str]]:
         """
         build reverse mapping: lemma -> list of words that map to it.
         
@@ -179,11 +269,24 @@ class Lemmatizer:
         return lemma_to_words
 
 
+def _lemmatize_chunk(
+    chunk: List[str],
+    model_name: str,
+    batch_size: int,
+    fast_mode: bool
+) -> Dict[str, str]:
+    """worker for create_lemma_mapping: builds its own Lemmatizer once."""
+    lemmatizer = Lemmatizer(model_name=model_name, fast_mode=fast_mode)
+    return lemmatizer.lemmatize_batch(chunk, batch_size=batch_size, n_process=1)
+
+
 def create_lemma_mapping(
     words: List[str],
     model_name: str = "en_core_web_sm",
-    batch_size: int = 1000,
-    verbose: bool = True
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    verbose: bool = True,
+    n_process: Optional[int] = None,
+    fast_mode: bool = False
 ) -> Dict[str, str]:
     """
     create word -> lemma mapping for a vocabulary using LemmInflect.
@@ -193,15 +296,23 @@ def create_lemma_mapping(
         model_name: spaCy model name (for POS tagging)
         batch_size: batch size for processing
         verbose: print progress
+        n_process: worker processes (default: cpu_count - 1). with the
+                   spaCy pipeline, vocabularies of 10k+ words are split into
+                   n_process chunks, each lemmatized in its own process
+        fast_mode: use direct LemmInflect lookups instead of the spaCy
+                   pipeline (default: False). much faster, but with no POS
+                   tag the first of VERB/NOUN/ADJ/ADV that knows the word
+                   wins, so some plural nouns get verb lemmas
+                   ("leaves" → "leave")
     
     returns:
         dict mapping word -> lemma
     
     note:
-        requires spaCy and LemmInflect to be installed.
+        requires LemmInflect (and spaCy unless fast_mode) to be installed.
         these are optional for runtime/server, only needed for preprocessing.
     """
-    if not SPACY_AVAILABLE:
+    if not fast_mode and not SPACY_AVAILABLE:
         raise RuntimeError(
             "spaCy is not installed. "
             "Install it with: pip install spacy && python -m spacy download en_core_web_sm"
@@ -213,15 +324,43 @@ def create_lemma_mapping(
             "Install it with: pip install lemminflect"
         )
     
-    if verbose:
-        print(f"initializing lemmatizer (model: {model_name}, using LemmInflect)...")
+    if n_process is None:
+        n_process = _default_n_process()
     
-    lemmatizer = Lemmatizer(model_name=model_name)
-    
-    if verbose:
-        print(f"lemmatizing {len(words):,} words...")
-    
-    lemma_map = lemmatizer.lemmatize_batch(words, batch_size=batch_size)
+    # fast_mode is a dict lookup per word - worker startup would cost more
+    if n_process > 1 and len(words) >= _PARALLEL_MIN_WORDS and not fast_mode:
+        # shard the vocab; each worker loads its own spaCy/LemmInflect once
+        chunk_size = -(-len(words) // n_process)
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+        
+        if verbose:
+            print(f"lemmatizing {len(words):,} words across {len(chunks)} processes...")
+        
+        worker = partial(
+            _lemmatize_chunk,
+            model_name=model_name,
+            batch_size=batch_size,
+            fast_mode=fast_mode,
+        )
+        lemma_map: Dict[str, str] = {}
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            for chunk_map in pool.map(worker, chunks):
+                lemma_map.update(chunk_map)
+    else:
+        if verbose:
+            if fast_mode:
+                print("initializing lemmatizer (LemmInflect lookups, no spaCy)...")
+            else:
+                print(f"initializing lemmatizer (model: {model_name}, using LemmInflect)...")
+        
+        lemmatizer = Lemmatizer(model_name=model_name, fast_mode=fast_mode)
+        
+        if verbose:
+            print(f"lemmatizing {len(words):,} words...")
+        
+        # in-process on purpose: small vocabs aren't worth spaCy's own
+        # multiprocessing either
+        lemma_map = lemmatizer.lemmatize_batch(words, batch_size=batch_size, n_process=1)
     
     if verbose:
         # show some stats
@@ -5,6 +5,8 @@ uses PCA to reduce from embed_dim → 3, with deterministic
 orientation so the same day always produces the same layout.
 """
 
+import hashlib
+
 import numpy as np
 from numpy.typing import NDArray
 
@@ -31,20 +33,26 @@ def project_to_3d(
     # extract local vectors
     local_vecs = embeddings[local_ids]  # shape (k, D)
     
-    # --- PCA via SVD ---
+    # --- PCA via eigendecomposition of the Gram matrix ---
     
     # center the data
     mean_vec = local_vecs.mean(axis=0)
     centered = local_vecs - mean_vec
     
-    # SVD: X = U @ S @ Vt
-    # U has shape (k, k), S has shape (min(k, D),), Vt has shape (D, D)
-    # we only need first 3 components
-    U, S, Vt = np.linalg.svd(centered, full_matrices=False)
+    # principal axes are the top eigenvectors of the (D, D) Gram matrix
+    # X^T X (the right singular vectors of X), which is much cheaper than
+    # an SVD of the (k, D) matrix. accumulate in float64 since forming
+    # X^T X squares the condition number.
+    # recomputed from scratch every call on purpose: it's a 100x100 eigh
+    # (~1ms), and warm-starting from another date's basis would make the
+    # layout depend on which dates were built before it.
+    centered64 = centered.astype(np.float64)
+    gram = centered64.T @ centered64
+    _, eigvecs = np.linalg.eigh(gram)  # ascending eigenvalues
+    top3 = eigvecs[:, ::-1][:, :3]  # shape (D, 3)
     
-    # project to 3D: take first 3 columns of U, scaled by singular values
-    # this gives us the principal component scores
-    coords = U[:, :3] * S[:3]  # shape (k, 3)
+    # project to 3D: principal component scores (= U[:, :3] * S[:3])
+    coords = centered64 @ top3  # shape (k, 3)
     
     # --- stabilize orientation ---
     
@@ -59,24 +67,16 @@ def project_to_3d(
         coords = coords / max_norm
     
     # stabilize sign of each axis using the first point (closest neighbor)
-    # this ensures consistent orientation across runs
+    # this ensures consistent orientation across runs: flip every axis
+    # where the anchor's projection is negative. an axis the anchor sits
+    # (numerically) on zero for is instead oriented so its largest-magnitude
+    # coordinate is positive.
     anchor = coords[0]  # closest neighbor to secret
+    extreme = coords[np.abs(coords).argmax(axis=0), np.arange(3)]
+    ref = np.where(np.abs(anchor) > 1e-8, anchor, extreme)
+    coords *= np.where(ref < 0, -1.0, 1.0)
     
-    for j in range(3):
-        # if the anchor's projection on this axis is negative, flip the axis
-        if anchor[j] < 0:
-            coords[:, j] *= -1
-    
-    # additional stabilization: ensure first non-zero coordinate of anchor is positive
-    # (handles edge case where anchor[0] == 0)
-    for j in range(3):
-        col_sum = np.sum(coords[:, j])
-        if abs(col_sum) > 1e-8:
-            if col_sum < 0:
-                coords[:, j] *= -1
-            break
-    
-    return coords.astype(np.float32)
+    return coords.astype("<f4")
 
 
 def projection_seed_for_date(date_str: str) -> int:
@@ -85,8 +85,10 @@ def projection_seed_for_date(date_str: str) -> int:
     
     (currently not used since PCA is deterministic,
     but useful if we switch to t-SNE/UMAP later)
+    
+    uses a 4-byte blake2b digest - cheaper than sha256 and we only need
+    32 bits. pinned: changing the hash changes every future seed.
     """
-    import hashlib
-    h = hashlib.sha256(date_str.encode("utf-8")).digest()
-    return int.from_bytes(h[8:12], byteorder="little")
+    h = hashlib.blake2b(date_str.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(h, byteorder="little")
 
@@ -28,10 +28,40 @@ class RankingResult:
     secret_id: int
 
 
+@dataclass
+class RankingWorkspace:
+    """
+    V-sized buffers reused across compute_rankings calls (e.g. backfills).
+    
+    the RankingResult of a call that used a workspace shares its rank
+    buffer, so copy it (or write it out) before the next call.
+    """
+    
+    # similarity scores, float32 (V,)
+    scores: NDArray[np.float32]
+    
+    # rank array handed back when no rank_out is given, '<u4' (V,)
+    rank: NDArray[np.uint32]
+    
+    # V, V-1, ..., 1 - the ranks scattered over the ascending argsort
+    rank_values: NDArray[np.uint32]
+    
+    @classmethod
+    def allocate(cls, vocab_size: int) -> "RankingWorkspace":
+        return cls(
+            scores=np.empty(vocab_size, dtype=np.float32),
+            rank=np.empty(vocab_size, dtype="<u4"),
+            rank_values=np.arange(vocab_size, 0, -1, dtype=np.uint32),
+        )
+
+
 def compute_rankings(
     embeddings: NDArray[np.float32],
     secret_id: int,
-    k: int = 512
+    k: int = 512,
+    rank_out: NDArray[np.uint32] | None = None,
+    scores_out: NDArray[np.float32] | None = None,
+    workspace: RankingWorkspace | None = None
 ) -> RankingResult:
     """
     compute full rankings and top-k neighborhood.
@@ -40,18 +70,45 @@ def compute_rankings(
         embeddings: normalized embeddings, shape (V, D)
         secret_id: index of the secret word
         k: number of neighbors to include in local cluster
+        rank_out: optional preallocated '<u4' array of shape (V,) to fill
+                  with ranks (e.g. a memmap from open_rank_memmap), so the
+                  full rank array is written straight to disk
+        scores_out: optional preallocated float32 array of shape (V,) for
+                    the similarity scores (avoids a V-sized temporary)
+        workspace: optional RankingWorkspace supplying the scores / rank
+                   buffers when scores_out / rank_out aren't given
     
     returns:
         RankingResult with rank array and local neighborhood
     """
     V = embeddings.shape[0]
     
+    if workspace is not None:
+        assert workspace.scores.shape == (V,), "workspace allocated for a different vocab size"
+        if scores_out is None:
+            scores_out = workspace.scores
+        if rank_out is None:
+            rank_out = workspace.rank
+    
+    # the GEMV only hits the SIMD BLAS path for C-contiguous float32;
+    # this is a no-op for the '<f4' mmap load_embeddings returns
+    if embeddings.dtype != np.float32 or not embeddings.flags.c_contiguous:
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    
     # get secret vector
-    secret_vec = embeddings[secret_id]  # shape (D,)
+    secret_vec = np.array(embeddings[secret_id])  # shape (D,)
     
     # compute cosine similarities (dot product since vectors are normalized)
     # this gives us scores in [-1, 1]
-    scores: NDArray[np.float32] = embeddings @ secret_vec  # shape (V,)
+    if scores_out is not None:
+        assert scores_out.shape == (V,) and scores_out.dtype == np.float32, "bad scores_out"
+        scores = scores_out
+    else:
+        scores = np.empty(V, dtype=np.float32)
+    # stays float32: rank.bin is an exact ordering the client looks guesses
+    # up in, and int8-quantized scores reorder almost every word. numpy
+    # has no int8 BLAS either - the widened int matmul is 3-5x slower.
+    np.dot(embeddings, secret_vec, out=scores)  # shape (V,)
     
     # --- top-k neighbors (excluding secret) ---
     
@@ -65,21 +122,38 @@ def compute_rankings(
     # if we somehow got fewer than k (shouldn't happen), just take what we have
     top_indices = top_indices[:k]
     
-    # sort by score descending
-    sorted_order = np.argsort(scores[top_indices])[::-1]
+    # sort by score descending (ascending on the negated scores, so the
+    # result is a plain contiguous array rather than a reversed view)
+    sorted_order = np.argsort(-scores[top_indices])
     local_ids = top_indices[sorted_order]
     local_scores = scores[local_ids]
     
     # --- full ranking ---
     
-    # argsort gives indices that would sort scores ascending,
-    # we want descending (highest score = rank 1)
-    order = np.argsort(scores)[::-1]
+    # argsort gives indices that would sort scores ascending; rather than
+    # walking a reversed view, hand out ranks V..1 in ascending order
+    # (highest score = rank 1). same result as sorting descending.
+    # note: keep sorting the float32 scores directly - numpy's default argsort
+    # is SIMD-accelerated for floats, while quantizing to uint32 keys falls
+    # back to timsort for kind="stable" (radix is only used for <=16-bit
+    # ints) and loses exact tie order near the secret.
+    # it also stays single-threaded on purpose: at V≈400k it's ~10ms, and
+    # backfills already run one date per core (write_daily_artifacts_batch),
+    # so threading inside a day would just oversubscribe the pool.
+    order = np.argsort(scores)
     
     # rank[i] = position of word i in the sorted order
     # rank 1 = most similar (should be the secret itself)
-    rank = np.empty(V, dtype=np.uint32)
-    rank[order] = np.arange(1, V + 1, dtype=np.uint32)
+    # allocated little-endian so write_daily_artifacts can skip the cast
+    if rank_out is not None:
+        assert rank_out.shape == (V,), f"rank_out shape mismatch: {rank_out.shape} != {(V,)}"
+        rank = rank_out
+    else:
+        rank = np.empty(V, dtype="<u4")
+    if workspace is not None:
+        rank[order] = workspace.rank_values
+    else:
+        rank[order] = np.arange(V, 0, -1, dtype=np.uint32)
     
     return RankingResult(
         rank=rank,
@@ -7,14 +7,32 @@ same date → same word, no matter where/when you run the builder.
 
 import hashlib
 import json
+from functools import lru_cache
 from pathlib import Path
 import re
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@lru_cache(maxsize=4096)
+def date_seed(date_str: str) -> int:
+    """
+    first 8 bytes (little-endian) of sha256(date_str) as an int.
+    
+    stays sha256 rather than a faster hash: every published day's secret
+    is derived from it, so swapping the hash would reshuffle the whole
+    calendar. the cost is a few µs per date, and memoized on top.
+    """
+    h = hashlib.sha256(date_str.encode("utf-8")).digest()
+    return int.from_bytes(h[:8], byteorder="little")
 
 
 def secret_for_date(
     date_str: str,
     vocab_size: int,
-    vocab: list[str],
+    vocab: Sequence[str],
     min_length: int = 3,
     alpha_only: bool = True,
     freqs: dict[str, int] | None = None,
@@ -39,44 +57,83 @@ def secret_for_date(
     if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
         raise ValueError(f"date must be YYYY-MM-DD, got: {date_str}")
     
-    # hash the date
-    h = hashlib.sha256(date_str.encode("utf-8")).digest()
-    
-    # interpret first 8 bytes as little-endian uint64
-    seed_int = int.from_bytes(h[:8], byteorder="little")
+    # hash the date → little-endian uint64
+    seed_int = date_seed(date_str)
     
     # derive initial candidate
     secret_id = seed_int % vocab_size
     
-    # skip "bad" tokens: too short, contains non-alpha, etc.
-    attempts = 0
-    max_attempts = vocab_size  # safety valve
+    # common case: the hashed slot is already a fine secret
+    if _is_eligible(vocab[secret_id], min_length, alpha_only, freqs, min_freq):
+        return secret_id
     
-    while attempts < max_attempts:
-        word = vocab[secret_id]
-        
-        # check validity
-        is_valid = True
-        
-        if len(word) < min_length:
-            is_valid = False
-        elif alpha_only and not word.isalpha():
-            is_valid = False
-        elif freqs is not None and freqs.get(word, 0) < min_freq:
-            # too rare to be a fun secret
-            is_valid = False
-        
-        if is_valid:
-            return secret_id
-        
-        # bump to next candidate
-        secret_id = (secret_id + 1) % vocab_size
-        attempts += 1
+    # otherwise take the next eligible id after it (wrapping), same as
+    # probing one slot at a time but via a cached eligibility scan
+    eligible = eligible_secret_ids(vocab, min_length, alpha_only, freqs, min_freq)
+    eligible = eligible[:np.searchsorted(eligible, vocab_size)]  # probe stays in [0, vocab_size)
+    if len(eligible) == 0:
+        # shouldn't happen with a reasonable vocab, but just in case
+        raise RuntimeError(f"couldn't find valid secret word after {vocab_size} attempts")
     
-    # shouldn't happen with a reasonable vocab, but just in case
-    raise RuntimeError(f"couldn't find valid secret word after {max_attempts} attempts")
+    pos = int(np.searchsorted(eligible, secret_id))
+    return int(eligible[pos % len(eligible)])
+
+
+def _is_eligible(
+    word: str,
+    min_length: int,
+    alpha_only: bool,
+    freqs: dict[str, int] | None,
+    min_freq: int,
+) -> bool:
+    """secret_for_date's per-word filter."""
+    if len(word) < min_length:
+        return False
+    if alpha_only and not word.isalpha():
+        return False
+    if freqs is not None and freqs.get(word, 0) < min_freq:
+        # too rare to be a fun secret
+        return False
+    return True
+
+
+# one-entry cache for eligible_secret_ids: (vocab, freqs, params, ids).
+# vocab lists aren't hashable, so the hit test is by identity.
+_eligible_cache: tuple | None = None
 
 
+def eligible_secret_ids(
+    vocab: Sequence[str],
+    min_length: int = 3,
+    alpha_only: bool = True,
+    freqs: dict[str, int] | None = None,
+    min_freq: int = 0,
+) -> NDArray[np.int64]:
+    """
+    sorted ids of every vocab word secret_for_date would accept.
+    
+    computed once per (vocab, filter settings) and reused, so backfills
+    over many dates pay the O(V) scan a single time.
+    """
+    global _eligible_cache
+    params = (min_length, alpha_only, min_freq)
+    cached = _eligible_cache
+    if cached is not None and cached[0] is vocab and cached[1] is freqs and cached[2] == params:
+        return cached[3]
+    
+    V = len(vocab)
+    mask = np.fromiter((len(w) for w in vocab), dtype=np.int64, count=V) >= min_length
+    if alpha_only:
+        mask &= np.fromiter((w.isalpha() for w in vocab), dtype=np.bool_, count=V)
+    if freqs is not None:
+        mask &= np.fromiter((freqs.get(w, 0) for w in vocab), dtype=np.int64, count=V) >= min_freq
+    
+    ids = np.flatnonzero(mask)
+    _eligible_cache = (vocab, freqs, params, ids)
+    return ids
+
+
+@lru_cache(maxsize=1024)
 def hash_secret(word: str, salt: str = "") -> str:
     """
     create a hash of the secret word for client-side verification.
@@ -90,6 +147,9 @@ def hash_secret(word: str, salt: str = "") -> str:
     
     returns:
         hex-encoded sha256 hash
+    
+    stays sha256 (not blake2b etc.) because browsers can only check it
+    via WebCrypto, which has no blake2. memoized for batch backfills.
     """
     payload = f"{word}{salt}".encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
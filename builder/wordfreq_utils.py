@@ -6,10 +6,25 @@ zipf frequencies from the `wordfreq` library.
 
 from __future__ import annotations
 
+import math
+import re
 from dataclasses import dataclass
 from typing import Iterable, List
 
-from wordfreq import zipf_frequency
+import numpy as np
+from wordfreq import get_frequency_dict, zipf_frequency
+
+
+# words wordfreq's tokenizer passes through unchanged (a single lowercase
+# ascii token), so a direct frequency-dict lookup gives the same answer
+_SIMPLE_TOKEN = re.compile(r"[a-z]+")
+
+# zipf_frequency(minimum=0.0) floors frequencies at 1e-9 (zipf 0)
+_MIN_FREQ = 1e-9
+
+# raw log10 zipf below (min_zipf - margin) can't round up to min_zipf:
+# 3-significant-digit + centibel rounding moves it by well under 0.01
+_ZIPF_MARGIN = 0.05
 
 
 @dataclass
@@ -18,6 +33,16 @@ class ScoredWord:
   zipf: float
 
 
+def _zipf_from_freq(freq: float) -> float:
+  """zipf_frequency's rounding, applied to a raw wordlist frequency."""
+  if freq <= 0.0:
+    return round(math.log(_MIN_FREQ, 10) + 9, 2)
+  freq = max(freq, _MIN_FREQ)
+  leading_zeroes = math.floor(-math.log(freq, 10))
+  freq = round(freq, leading_zeroes + 3)
+  return round(math.log(freq, 10) + 9, 2)
+
+
 def score_vocab(
   vocab: Iterable[str],
   *,
@@ -28,11 +53,37 @@ def score_vocab(
   """score each vocab word with its zipf frequency.
 
   only keeps words with zipf >= min_zipf.
+
+  simple lowercase words skip wordfreq's tokenizer: their frequencies are
+  pulled straight from the frequency dict into a numpy array, and only
+  words whose raw zipf is near or above min_zipf get the exact
+  (python-rounded) zipf_frequency value. anything else falls back to
+  zipf_frequency itself, so results match it exactly.
   """
+  words = list(vocab)
+  freqs = get_frequency_dict(lang, wordlist)
+
+  simple = np.fromiter(
+    (_SIMPLE_TOKEN.fullmatch(w) is not None for w in words), dtype=np.bool_, count=len(words)
+  )
+  raw_freq = np.fromiter(
+    (freqs.get(w, 0.0) if s else 0.0 for w, s in zip(words, simple.tolist())),
+    dtype=np.float64,
+    count=len(words),
+  )
+  with np.errstate(divide="ignore"):
+    raw_zipf = np.log10(np.maximum(raw_freq, _MIN_FREQ)) + 9
+
+  # non-simple words always take the slow, exact path
+  maybe = ~simple | (raw_zipf >= min_zipf - _ZIPF_MARGIN)
+
   scored: list[ScoredWord] = []
-  for w in vocab:
-    z = float(zipf_frequency(w, lang, wordlist=wordlist))
+  for i in np.flatnonzero(maybe).tolist():
+    w = words[i]
+    if simple[i]:
+      z = _zipf_from_freq(float(raw_freq[i]))
+    else:
+      z = float(zipf_frequency(w, lang, wordlist=wordlist))
     if z >= min_zipf:
       scored.append(ScoredWord(word=w, zipf=z))
   return scored
-
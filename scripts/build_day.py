@@ -5,6 +5,7 @@ build daily artifacts for embeddage.
 usage:
     python scripts/build_day.py --date 2024-12-18
     python scripts/build_day.py --date 2024-12-18 --output-root docs/
+    python scripts/build_day.py --date 2024-12-01 --end-date 2024-12-31  # backfill
 
 generates:
     - {output}/data/{date}.meta.json
@@ -14,11 +15,13 @@ generates:
 """
 
 import argparse
-import json
 import sys
-import hashlib
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import Collection, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 
 # add parent dir to path so we can import builder
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -26,13 +29,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from builder import (
     Config,
     load_embeddings,
-    load_vocab,
+    load_vocab_mmap,
     secret_for_date,
     compute_rankings,
     project_to_3d,
     write_daily_artifacts,
+    write_daily_artifacts_batch,
 )
+from builder.artifacts import open_rank_memmap
+from builder.embeddings import load_word_index, lookup_word_ids
 from builder.filters import load_obscene_words
+from builder.jsonio import load_json
+from builder.word_of_day import date_seed
 
 
 def get_today_ny() -> str:
@@ -47,6 +55,59 @@ def get_today_ny() -> str:
         return datetime.utcnow().strftime("%Y-%m-%d")
 
 
+def date_range(start: str, end: str) -> list[str]:
+    """inclusive list of YYYY-MM-DD strings from start to end."""
+    d0 = date.fromisoformat(start)
+    d1 = date.fromisoformat(end)
+    return [(d0 + timedelta(days=i)).isoformat() for i in range((d1 - d0).days + 1)]
+
+
+def load_secret_candidate_ids(
+    vocab: Sequence[str],
+    blacklist: Collection[str],
+    config: Config
+) -> NDArray[np.int64] | None:
+    """
+    load the wordfreq-based secret pool as vocab ids.
+
+    returns None if data/secret_candidates.json doesn't exist, otherwise
+    the (possibly empty) array of usable, non-blacklisted candidate ids.
+    """
+    secret_candidates_path = Path("data/secret_candidates.json")
+    if not secret_candidates_path.exists():
+        return None
+
+    print(f"  using secret_candidates from {secret_candidates_path}...")
+    cand_data = load_json(secret_candidates_path)
+    cand_words = cand_data.get("words", [])
+
+    # build_secret_candidates already drops blacklisted words; this pass
+    # only catches blacklist edits made since. load_obscene_words returns
+    # a set (or a marisa trie for huge lists), so it's one O(1) probe each
+    if blacklist:
+        cand_words = [w for w in cand_words if w not in blacklist]
+
+    # map vocab word -> id via the cached word index: one searchsorted
+    # probe per word (no full-vocab dict, no `in` + `[]` double lookup)
+    word_index = load_word_index(config, vocab)
+    ids = lookup_word_ids(cand_words, vocab, word_index)
+    return ids[ids >= 0]
+
+
+def pick_secret(
+    date_str: str,
+    vocab: Sequence[str],
+    candidate_ids: NDArray[np.int64] | None
+) -> int:
+    """deterministic secret id for a date, from the candidate pool if any."""
+    if candidate_ids is not None and len(candidate_ids):
+        # deterministic pick: hash date, index into candidate_ids
+        return int(candidate_ids[date_seed(date_str) % len(candidate_ids)])
+
+    # fallback: original deterministic selection over full vocab
+    return secret_for_date(date_str, len(vocab), vocab)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="generate daily embeddage artifacts"
@@ -75,6 +136,18 @@ def main():
         default=512,
         help="number of neighbors in local cluster (default: 512)"
     )
+    parser.add_argument(
+        "--end-date",
+        type=str,
+        default=None,
+        help="backfill every date from --date through this date (inclusive), in parallel"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for --end-date backfills (default: cpu count)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -108,7 +181,8 @@ def main():
     
     # load data
     print("loading vocab...")
-    vocab = load_vocab(config)
+    # mmap'd words.bytes/.offsets when present, else parses words.json
+    vocab = load_vocab_mmap(config)
     V = len(vocab)
     print(f"  vocab size: {V:,}")
     print("loading embeddings...")
@@ -124,38 +198,32 @@ def main():
         print(f"loaded blacklist for secret selection ({len(blacklist):,} entries)")
 
     # try to use precomputed wordfreq-based secret candidate pool if available
-    secret_candidates_path = Path("data/secret_candidates.json")
-    secret_id: int
-
-    if secret_candidates_path.exists():
-        print(f"  using secret_candidates from {secret_candidates_path}...")
-        with open(secret_candidates_path, "r", encoding="utf-8") as f:
-            cand_data = json.load(f)
-        cand_words = cand_data.get("words", [])
-
-        # map vocab word -> id
-        word_to_id = {w: i for i, w in enumerate(vocab)}
-
-        if blacklist:
-            cand_words = [w for w in cand_words if w not in blacklist]
-
-        candidate_ids = [word_to_id[w] for w in cand_words if w in word_to_id]
-
-        if candidate_ids:
-            # deterministic pick: hash date, index into candidate_ids
-            h = hashlib.sha256(date_str.encode("utf-8")).digest()
-            seed_int = int.from_bytes(h[:8], byteorder="little")
-            secret_id = candidate_ids[seed_int % len(candidate_ids)]
-            secret_word = vocab[secret_id]
-            print(f"  picked from {len(candidate_ids):,} candidates")
-        else:
-            print("  warning: secret_candidates.json had no usable entries, falling back to full vocab")
-            secret_id = secret_for_date(date_str, V, vocab)
-            secret_word = vocab[secret_id]
-    else:
-        # fallback: original deterministic selection over full vocab
-        secret_id = secret_for_date(date_str, V, vocab)
-        secret_word = vocab[secret_id]
+    candidate_ids = load_secret_candidate_ids(vocab, blacklist, config)
+    if candidate_ids is not None and len(candidate_ids):
+        print(f"  picking from {len(candidate_ids):,} candidates")
+    elif candidate_ids is not None:
+        print("  warning: secret_candidates.json had no usable entries, falling back to full vocab")
+
+    if args.end_date:
+        # backfill: select every secret up front, then fan dates out to workers
+        dates = date_range(date_str, args.end_date)
+        secrets = {}
+        for d in dates:
+            sid = pick_secret(d, vocab, candidate_ids)
+            secrets[d] = (sid, vocab[sid])
+            if args.verbose:
+                print(f"  {d}: '{vocab[sid]}' (id={sid})")
+
+        print(f"building {len(dates)} days into {output_dir}...")
+        all_paths = write_daily_artifacts_batch(
+            secrets, config, output_dir=output_dir, max_workers=args.workers
+        )
+        print(f"\nwrote artifacts for {len(all_paths)} days")
+        print("\ndone!")
+        return
+
+    secret_id = pick_secret(date_str, vocab, candidate_ids)
+    secret_word = vocab[secret_id]
     
     if args.verbose:
         print(f"  secret: '{secret_word}' (id={secret_id})")
@@ -164,7 +232,8 @@ def main():
     
     # compute rankings
     print("computing rankings...")
-    result = compute_rankings(embeddings, secret_id, k=config.k)
+    rank_out = open_rank_memmap(date_str, V, config, output_dir)
+    result = compute_rankings(embeddings, secret_id, k=config.k, rank_out=rank_out)
     print(f"  rank[secret] = {result.rank[secret_id]} (should be 1)")
     
     if args.verbose:
@@ -11,7 +11,8 @@ outputs:
         "wordlist": "small",
         "min_zipf": 3.0,
         "words": ["..."],
-        "zipf": [3.42, ...]
+        "zipf_scale": 100,
+        "zipf": [342, ...]      # zipf * zipf_scale, as ints
       }
 
 we can later use this list to restrict daily secrets to common-ish words.
@@ -19,7 +20,6 @@ we can later use this list to restrict daily secrets to common-ish words.
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
@@ -28,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from builder.config import DEFAULT_CONFIG
 from builder.embeddings import load_vocab
+from builder.jsonio import dump_json
 from builder.wordfreq_utils import score_vocab
 from builder.filters import load_obscene_words
 
@@ -61,16 +62,18 @@ def main() -> None:
   out_path = Path("data/secret_candidates.json")
   out_path.parent.mkdir(parents=True, exist_ok=True)
 
+  # wordfreq rounds zipf to 2 decimals, so centi-zipf ints are lossless
+  # and much shorter than float reprs
   payload = {
     "lang": "en",
     "wordlist": "small",
     "min_zipf": 3.0,
     "words": [s.word for s in scored],
-    "zipf": [s.zipf for s in scored],
+    "zipf_scale": 100,
+    "zipf": [round(s.zipf * 100) for s in scored],
   }
 
-  with open(out_path, "w", encoding="utf-8") as f:
-    json.dump(payload, f)
+  dump_json(payload, out_path)
 
   print(f"wrote {len(scored):,} candidates to {out_path}")
 
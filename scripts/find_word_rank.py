@@ -4,10 +4,16 @@ find the rank of a specific word for a given date.
 """
 
 import argparse
-import json
-import struct
+import sys
 from pathlib import Path
 
+import numpy as np
+
+# add parent dir to path so we can import builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from builder.jsonio import load_json
+
 
 def main():
     parser = argparse.ArgumentParser(description="find word rank for a date")
@@ -22,40 +28,40 @@ def main():
     
     # load meta
     meta_path = output_dir / f"{args.date}.meta.json"
-    with open(meta_path, "r", encoding="utf-8") as f:
-        meta = json.load(f)
+    meta = load_json(meta_path)
     
     vocab_size = meta["vocab_size"]
     secret_word = meta.get("secret_word", "?")
     
     # load words
     words_path = args.data_dir / "words.json"
-    with open(words_path, "r", encoding="utf-8") as f:
-        words = json.load(f)
+    words = load_json(words_path)
     
-    # find word index
+    # find word index: scan from the end so a case-folded duplicate resolves
+    # to its last id, without building a V-entry lookup dict for one word
     search_word = args.word.lower().strip()
-    word_to_id = {w.lower(): i for i, w in enumerate(words)}
+    word_id = next(
+        (i for i in range(len(words) - 1, -1, -1) if words[i].lower() == search_word),
+        None,
+    )
     
-    if search_word not in word_to_id:
+    if word_id is None:
         print(f"'{args.word}' not found in vocabulary")
         sys.exit(1)
     
-    word_id = word_to_id[search_word]
     actual_word = words[word_id]
     
     # load rank
     rank_path = output_dir / f"{args.date}.rank.bin"
-    with open(rank_path, "rb") as f:
-        data = f.read()
-    
     expected_size = 4 * vocab_size
-    if len(data) != expected_size:
-        raise ValueError(f"rank.bin size mismatch: {len(data)} != {expected_size}")
+    actual_size = rank_path.stat().st_size
+    if actual_size != expected_size:
+        raise ValueError(f"rank.bin size mismatch: {actual_size} != {expected_size}")
     
-    # unpack as little-endian uint32
-    rank = struct.unpack(f"<{vocab_size}I", data)
-    word_rank = rank[word_id]
+    # map as little-endian uint32: only the pages holding the two ranks
+    # we look up are ever read
+    rank = np.memmap(rank_path, dtype="<u4", mode="r", shape=(vocab_size,))
+    word_rank = int(rank[word_id])
     
     print(f"date: {args.date}")
     print(f"secret word: {secret_word}")
@@ -70,7 +76,7 @@ def main():
     if secret_word:
         secret_id = meta.get("secret_id")
         if secret_id is not None:
-            secret_rank = rank[secret_id]
+            secret_rank = int(rank[secret_id])
             print(f"\nsecret '{secret_word}' is rank {secret_rank}")
             if word_rank < secret_rank:
                 print(f"'{actual_word}' is {secret_rank - word_rank} ranks BETTER than the secret (closer)")
@@ -81,7 +87,6 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     main()
 
 
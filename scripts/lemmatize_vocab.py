@@ -7,6 +7,7 @@ run this after preprocess_glove.py has created data/words.json.
 
 usage:
     python scripts/lemmatize_vocab.py
+    python scripts/lemmatize_vocab.py --fast  # LemmInflect lookups only, no spaCy
     
 output:
     - data/lemmas.json (word_to_lemma and lemma_to_words mappings)
@@ -14,8 +15,10 @@ output:
 requirements:
     pip install spacy lemminflect
     python -m spacy download en_core_web_sm
+    (--fast only needs lemminflect)
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
@@ -24,10 +27,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from builder.config import DEFAULT_CONFIG
+from builder.jsonio import dump_json
 from builder.lemmatization import create_lemma_mapping, Lemmatizer
 
 
 def main():
+    parser = argparse.ArgumentParser(description="lemmatize the vocabulary")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="skip spaCy and use direct LemmInflect lookups (faster; without "
+             "POS tags some plural nouns get verb lemmas, e.g. leaves → leave)"
+    )
+    args = parser.parse_args()
+
     vocab_path = DEFAULT_CONFIG.vocab_path
     
     if not vocab_path.exists():
@@ -43,13 +56,15 @@ def main():
     print()
     
     # check if spaCy is available
-    try:
-        import spacy
-    except ImportError:
-        print("error: spaCy not installed")
-        print("install it with: pip install spacy")
-        print("then download the model: python -m spacy download en_core_web_sm")
-        sys.exit(1)
+    if not args.fast:
+        try:
+            import spacy
+        except ImportError:
+            print("error: spaCy not installed")
+            print("install it with: pip install spacy")
+            print("then download the model: python -m spacy download en_core_web_sm")
+            print("(or rerun with --fast to skip spaCy)")
+            sys.exit(1)
     
     # check if LemmInflect is available
     try:
@@ -60,16 +75,17 @@ def main():
         sys.exit(1)
     
     # check if model is available
-    try:
-        lemmatizer = Lemmatizer()
-    except RuntimeError as e:
-        print(f"error: {e}")
-        print("download the model with: python -m spacy download en_core_web_sm")
-        sys.exit(1)
+    if not args.fast:
+        try:
+            Lemmatizer()
+        except RuntimeError as e:
+            print(f"error: {e}")
+            print("download the model with: python -m spacy download en_core_web_sm")
+            sys.exit(1)
     
     # create lemma mapping
     print("creating lemma mapping (this may take a while)...")
-    lemma_map = create_lemma_mapping(words, verbose=True)
+    lemma_map = create_lemma_mapping(words, verbose=True, fast_mode=args.fast)
     
     # create reverse mapping: lemma -> list of words
     print("\nbuilding reverse mapping (lemma -> words)...")
@@ -94,8 +110,7 @@ def main():
     output_path = DEFAULT_CONFIG.data_dir / "lemmas.json"
     print(f"\nsaving lemma mapping to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(lemma_data, f, indent=2)
+    dump_json(lemma_data, output_path, indent=True)
     
     # stats
     unique_lemmas = len(lemma_to_words)
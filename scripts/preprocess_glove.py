@@ -7,12 +7,16 @@ usage:
 
 this creates:
     - data/words.json (vocab list)
+    - data/words.bytes + .offsets (same vocab as a UTF-8 blob + '<u4' offsets, for mmap)
     - data/embeddings_normed.npy (normalized embeddings)
+    - data/embeddings_normed.bin + .shape.json (same data, headerless '<f4' for mmap)
 
 you only need to run this once. the daily builder uses these preprocessed files.
+re-running with the same inputs and options is a no-op (see --force).
 """
 
 import argparse
+import hashlib
 import sys
 from pathlib import Path
 
@@ -23,6 +27,42 @@ from builder.config import DEFAULT_CONFIG
 from builder.embeddings import preprocess_glove
 
 
+FINGERPRINT_FILE = ".preprocess_fingerprint"
+
+
+def _file_stamp(path: Path | None) -> tuple | None:
+    """(path, mtime_ns, size) for an input file, or None if it's absent."""
+    if path is None or not path.exists():
+        return None
+    st = path.stat()
+    return (str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def input_fingerprint(args: argparse.Namespace) -> str:
+    """
+    hash of everything that determines preprocess_glove's output.
+
+    input files are keyed by mtime + size rather than content, so
+    checking the fingerprint never reads the multi-GB GloVe file.
+    """
+    # mirror load_obscene_words' default lookup when no list is given
+    obscene_paths = (
+        [args.obscene_list] if args.obscene_list is not None
+        else [Path("data/obscene_words.txt"), Path("data/blacklist.txt")]
+    )
+    key = [
+        _file_stamp(args.glove_path),
+        args.dim,
+        args.min_length,
+        args.no_filter,
+        _file_stamp(args.english_dict),
+        [_file_stamp(p) for p in obscene_paths],
+        args.no_lemmatize,
+        str(args.lemma_output),
+    ]
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="preprocess GloVe embeddings into fast-loadable format"
@@ -79,6 +119,17 @@ def main():
         default=None,
         help="path for lemma mapping JSON (default: {output-dir}/lemmas.json)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="processes for parsing the GloVe file (default: cpu count)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the outputs are up to date"
+    )
 
     args = parser.parse_args()
 
@@ -88,6 +139,29 @@ def main():
 
     output_vocab = args.output_dir / DEFAULT_CONFIG.vocab_file
     output_embeddings = args.output_dir / DEFAULT_CONFIG.embeddings_file
+    output_lemmas = None
+    if not args.no_lemmatize:
+        output_lemmas = args.lemma_output or args.output_dir / "lemmas.json"
+    outputs = [p for p in (output_vocab, output_embeddings, output_lemmas) if p]
+
+    # skip the whole parse if these exact inputs were already processed
+    fingerprint_path = args.output_dir / FINGERPRINT_FILE
+    fingerprint = input_fingerprint(args)
+    if (
+        not args.force
+        and fingerprint_path.exists()
+        and fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint
+        and all(p.exists() for p in outputs)
+    ):
+        print(f"{', '.join(map(str, outputs))} are up to date (use --force to rebuild)")
+        return
+
+    # drop the old stamp first so an interrupted run is never "up to date",
+    # and any old lemma mapping so a failed lemmatization can't leave one
+    # built for a different vocab looking current
+    fingerprint_path.unlink(missing_ok=True)
+    if output_lemmas is not None:
+        output_lemmas.unlink(missing_ok=True)
 
     # if no explicit obscene list path is provided, we let preprocess_glove()
     # fall back to its internal default (data/obscene_words.txt).
@@ -104,8 +178,14 @@ def main():
         obscene_words_path=obscene_list_path,
         lemmatize=not args.no_lemmatize,
         lemma_output_path=args.lemma_output,
+        workers=args.workers,
     )
 
+    # only stamp a complete build: lemmatization can fail (or be skipped
+    # when spaCy is missing) without failing the run
+    if all(p.exists() for p in outputs):
+        fingerprint_path.write_text(fingerprint + "\n", encoding="utf-8")
+
     print("\npreprocessing complete!")
     print(f"  vocab: {output_vocab} ({vocab_size:,} words)")
     print(f"  embeddings: {output_embeddings}")
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-set up docs/ directory structure and copy vocab.
+set up docs/ directory structure and publish vocab (hardlinked when possible).
 
 usage:
     python scripts/setup_docs.py
@@ -8,6 +8,7 @@ usage:
 run this after preprocess_glove.py and before building frontend.
 """
 
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -18,44 +19,67 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from builder.config import DEFAULT_CONFIG
 
 
+def _publish(src: Path, dst: Path) -> None:
+    """
+    hardlink src to dst (no data copied), copying instead if linking fails.
+
+    falls back for cross-filesystem docs/ dirs or filesystems without
+    hardlink support. linking is safe because dump_json replaces its output
+    file rather than rewriting it, so regenerating data/ leaves docs/ alone
+    until this is run again.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # shutil already does the zero-copy part: on Linux copyfile uses
+        # os.sendfile (fcopyfile on macOS) under the hood
+        shutil.copy(src, dst)
+
+
 def main():
     docs_dir = Path("docs")
-    data_dir = docs_dir / "data"
     
-    # create directories
+    # create directories (docs/data/ is created by build_day when it
+    # writes the first day's artifacts)
     print(f"creating {docs_dir}...")
     docs_dir.mkdir(exist_ok=True)
     
-    print(f"creating {data_dir}...")
-    data_dir.mkdir(exist_ok=True)
-    
-    # copy vocab
+    # copy vocab (kept as JSON: the frontend fetches it with res.json(),
+    # and the static host compresses it on the wire)
     src = DEFAULT_CONFIG.vocab_path
     dst = docs_dir / "words.json"
     
-    if not src.exists():
+    try:
+        src_size = src.stat().st_size
+    except FileNotFoundError:
         print(f"error: vocab not found at {src}")
         print("run scripts/preprocess_glove.py first!")
         sys.exit(1)
     
-    print(f"copying {src} → {dst}...")
-    shutil.copy(src, dst)
+    print(f"publishing {src} → {dst}...")
+    _publish(src, dst)
     
-    # copy lemma mapping if it exists
+    # copy lemma mapping if it exists (one stat, reused below)
     lemma_src = DEFAULT_CONFIG.data_dir / "lemmas.json"
     lemma_dst = docs_dir / "lemmas.json"
     
-    if lemma_src.exists():
-        print(f"copying {lemma_src} → {lemma_dst}...")
-        shutil.copy(lemma_src, lemma_dst)
+    try:
+        lemma_size: int | None = lemma_src.stat().st_size
+    except FileNotFoundError:
+        lemma_size = None
+    
+    if lemma_size is not None:
+        print(f"publishing {lemma_src} → {lemma_dst}...")
+        _publish(lemma_src, lemma_dst)
     else:
         print(f"note: {lemma_src} not found (lemmatization skipped or not available)")
     
+    # published files are links/copies of the sources, so reuse their sizes
     print("\ndocs/ setup complete!")
-    print(f"  {dst} ({dst.stat().st_size:,} bytes)")
-    if lemma_src.exists():
-        print(f"  {lemma_dst} ({lemma_dst.stat().st_size:,} bytes)")
-
+    print(f"  {dst} ({src_size:,} bytes)")
+    if lemma_size is not None:
+        print(f"  {lemma_dst} ({lemma_size:,} bytes)")
 
 if __name__ == "__main__":
     main()
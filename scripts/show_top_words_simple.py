@@ -1,71 +1,116 @@
 #!/usr/bin/env python3
 """
-display top N words for a given date's secret word.
+display top N words for a given date's secret word (or several dates).
+
+reads only binary, mmap-able inputs on the hot path:
+    - {output}/data/{date}.rank.bin (uint32 LE ranks)
+    - {data-dir}/words.bytes + words.offsets (vocab blob, see load_vocab_mmap)
+so only the N printed words are ever decoded. older data dirs without
+words.bytes fall back to parsing words.json.
 """
 
 import argparse
-import json
-import struct
+import sys
 from pathlib import Path
+from typing import Sequence
 
+import numpy as np
 
-def main():
-    parser = argparse.ArgumentParser(description="display top words for a date")
-    parser.add_argument("--date", type=str, required=True, help="target date YYYY-MM-DD")
-    parser.add_argument("--top", type=int, default=50, help="number of top words to show")
-    parser.add_argument("--output-root", type=Path, default=Path("docs"), help="output root")
-    parser.add_argument("--data-dir", type=Path, default=Path("data"), help="data directory")
-    
-    args = parser.parse_args()
-    
-    output_dir = args.output_root / "data"
-    
+# add parent dir to path so we can import builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from builder.config import Config
+from builder.embeddings import load_vocab_mmap
+from builder.jsonio import load_json
+
+
+def show_date(
+    date_str: str,
+    output_dir: Path,
+    top: int,
+    words: Sequence[str] | None,
+    data_dir: Path
+) -> Sequence[str]:
+    """print one date's top words; returns the vocab so callers can reuse it."""
     # load meta
-    meta_path = output_dir / f"{args.date}.meta.json"
-    with open(meta_path, "r", encoding="utf-8") as f:
-        meta = json.load(f)
+    meta_path = output_dir / f"{date_str}.meta.json"
+    meta = load_json(meta_path)
     
     vocab_size = meta["vocab_size"]
     secret_word = meta.get("secret_word", "?")
     secret_id = meta.get("secret_id")
     
-    print(f"date: {args.date}")
+    print(f"date: {date_str}")
     print(f"secret word: {secret_word}")
     if secret_id is not None:
         print(f"secret id: {secret_id}")
     print(f"vocab size: {vocab_size:,}")
     print()
     
-    # load words
-    print("loading words...")
-    words_path = args.data_dir / "words.json"
-    with open(words_path, "r", encoding="utf-8") as f:
-        words = json.load(f)
-    print(f"  loaded {len(words):,} words")
+    # load words (once, on the first date)
+    if words is None:
+        print("loading words...")
+        # mmap'd words.bytes/.offsets: only the N printed words get decoded
+        # (falls back to parsing words.json for older data dirs)
+        words = load_vocab_mmap(Config(data_dir=data_dir))
+        print(f"  loaded {len(words):,} words")
     
     # load rank
     print("loading rankings...")
-    rank_path = output_dir / f"{args.date}.rank.bin"
-    with open(rank_path, "rb") as f:
-        data = f.read()
-    
+    rank_path = output_dir / f"{date_str}.rank.bin"
     expected_size = 4 * vocab_size
-    if len(data) != expected_size:
-        raise ValueError(f"rank.bin size mismatch: {len(data)} != {expected_size}")
+    actual_size = rank_path.stat().st_size
+    if actual_size != expected_size:
+        raise ValueError(f"rank.bin size mismatch: {actual_size} != {expected_size}")
     
-    # unpack as little-endian uint32
-    rank = struct.unpack(f"<{vocab_size}I", data)
+    # map as a little-endian uint32 array (no per-rank python ints, and
+    # pages come straight from the OS cache on repeat runs)
+    rank = np.memmap(rank_path, dtype="<u4", mode="r", shape=(vocab_size,))
     print(f"  loaded {len(rank):,} ranks")
     
-    # create (word, rank) pairs and sort by rank
-    pairs = [(words[i], rank[i]) for i in range(len(words))]
-    pairs.sort(key=lambda x: x[1])
+    # select the N best ranks with a partition, then sort just those
+    rank = rank[:len(words)]
+    n = min(top, len(rank))
+    if n < len(rank):
+        idx = np.argpartition(rank, n)[:n]
+    else:
+        idx = np.arange(len(rank))
+    idx = idx[np.argsort(rank[idx])]
     
     # display top N
-    print(f"\ntop {args.top} words:")
+    print(f"\ntop {top} words:")
     print("-" * 50)
-    for i, (word, r) in enumerate(pairs[:args.top], 1):
-        print(f"{i:3d}. {word:20s} (rank {r:,})")
+    # one write for the whole table rather than a print (and flush) per row
+    lines = [f"{i:3d}. {words[j]:20s} (rank {int(rank[j]):,})" for i, j in enumerate(idx, 1)]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description="display top words for a date")
+    which = parser.add_mutually_exclusive_group(required=True)
+    which.add_argument("--date", type=str, help="target date YYYY-MM-DD")
+    which.add_argument(
+        "--dates",
+        type=str,
+        help="comma-separated dates; the vocab is loaded once for all of them"
+    )
+    parser.add_argument("--top", type=int, default=50, help="number of top words to show")
+    parser.add_argument("--output-root", type=Path, default=Path("docs"), help="output root")
+    parser.add_argument("--data-dir", type=Path, default=Path("data"), help="data directory")
+    
+    args = parser.parse_args()
+    
+    output_dir = args.output_root / "data"
+    dates = [args.date] if args.date else [d.strip() for d in args.dates.split(",") if d.strip()]
+    
+    words = None
+    for n, date_str in enumerate(dates):
+        if n:
+            print("\n" + "=" * 50 + "\n")
+        words = show_date(date_str, output_dir, args.top, words, args.data_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from builder.embeddings import _check_glove_width, _parse_glove_chunk
+
+
+def test_parse_glove_chunk_starting_on_too_wide_line(tmp_path):
+    # a chunk whose first line has D+2 fields must not shift the whole chunk
+    head = b"alpha 1 2 3\n"
+    tail = b"wide 1 2 3 4\nbeta 4 5 6\nshort 1\ngamma 7 8 9\nwider 1 2 3 4 5 6\n"
+    path = tmp_path / "glove.txt"
+    path.write_bytes(head + tail)
+    size = len(head + tail)
+
+    words, vecs, skipped = _parse_glove_chunk(path, len(head), size, 3)
+    assert list(words) == ["beta", "gamma"]
+    np.testing.assert_array_equal(vecs, [[4, 5, 6], [7, 8, 9]])
+    assert skipped == 3  # wide, short and wider (the last via on_bad_lines)
+
+    # chunked parse agrees with a single pass over the file
+    words, vecs, skipped = _parse_glove_chunk(path, 0, size, 3)
+    assert list(words) == ["alpha", "beta", "gamma"]
+    assert vecs.shape == (3, 3)
+    assert skipped == 3
+
+
+def test_header_and_trailing_spaces_are_not_fatal(tmp_path):
+    # word2vec-style header, then rows with a trailing space
+    path = tmp_path / "glove.txt"
+    path.write_bytes(b"2 3\nalpha 1 2 3 \nbeta 4 5 6 \n")
+    _check_glove_width(path, 3)
+
+    words, vecs, skipped = _parse_glove_chunk(path, 0, path.stat().st_size, 3)
+    assert list(words) == ["alpha", "beta"]
+    assert skipped == 1
+
+    with pytest.raises(ValueError, match="expected 5 columns"):
+        _check_glove_width(path, 4)